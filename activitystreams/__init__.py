@@ -12,4 +12,21 @@ import datetime
 __created__ = datetime.datetime(2023, 7, 16)
 __updated__ = datetime.datetime(2024, 2, 22)
 
-from activitystreams.package import create_package, create_engine
+
+def __getattr__(name):
+    # loads the packaging/engine machinery (and pyld with it) on first use
+    # instead of at import time; programs that only want the model classes
+    # never pay for it
+    if name in ('create_package', 'create_engine'):
+        from activitystreams import package
+        globals()['create_package'] = package.create_package
+        globals()['create_engine'] = package.create_engine
+        return globals()[name]
+    if name in ('models', 'properties', 'package'):
+        # the eager import used to bind these as package attributes;
+        # importing a submodule also sets it on the package, so this only
+        # runs once per name
+        from importlib import import_module
+        return import_module(f'{__name__}.{name}')
+    raise AttributeError(
+        f"module '{__name__}' has no attribute '{name}'")
@@ -8,6 +8,7 @@ handled correctly.
 # abstraction from the spec
 import logging
 from collections.abc import Sized
+from weakref import WeakValueDictionary
 
 from jsonld import ApplicationActivityJson
 from jsonld import jsonld_get
@@ -19,6 +20,28 @@ logger.setLevel(logging.INFO)
 ACTIVITYSTREAMS_NS = 'https://www.w3.org/ns/activitystreams'
 SECURE_URLS_ONLY = False
 
+# lets consumers star-import the vocabulary in one statement instead of
+# maintaining a fifty-name import list
+__all__ = [
+    'ACTIVITYSTREAMS_NS',
+    'Object', 'Link', 'Activity', 'IntransitiveActivity', 'Collection',
+    'OrderedCollection', 'CollectionPage', 'OrderedCollectionPage',
+    'Accept', 'TentativeAccept', 'Add', 'Arrive', 'Create', 'Delete',
+    'Follow', 'Ignore', 'Join', 'Leave', 'Like', 'Offer', 'Invite',
+    'Reject', 'TentativeReject', 'Remove', 'Undo', 'Update', 'View',
+    'Listen', 'Read', 'Move', 'Travel', 'Announce', 'Block', 'Flag',
+    'Dislike', 'Question', 'Application', 'Group', 'Organization', 'Person',
+    'Service', 'Relationship', 'Article', 'Document', 'Audio', 'Image',
+    'Video', 'Note', 'Page', 'Event', 'Place', 'Profile', 'Tombstone',
+    'Mention',
+]
+
+# shared Link instances produced by Link.intern, keyed by (class, href) so a
+# Mention is never handed back where a plain Link was requested (or one
+# package's clone where another's was wanted). weak values mean entries
+# disappear as soon as nothing else references the link
+_interned_links = WeakValueDictionary()
+
 
 # ==//==//==//==//==//==//==//==//==//==//==//==//==//==//==//==//==//==//==//
 # CORE TYPES
@@ -38,6 +61,9 @@ class Object(ApplicationActivityJson):
     IntransitiveActivity, Collection and OrderedCollection.
     """
     type = "Object"
+    # lets consumers destructure with positional patterns, e.g.
+    # "case Note(type, id):", instead of isinstance ladders
+    __match_args__ = ('type', 'id')
 
     @classmethod
     def __get_namespace__(cls):
@@ -95,6 +121,7 @@ class Link(ApplicationActivityJson):
     the reference as opposed to properties of the resource
     """
     type = "Link"
+    __match_args__ = ('href', 'name')
 
     @classmethod
     def __get_namespace__(cls):
@@ -121,6 +148,24 @@ class Link(ApplicationActivityJson):
         self.context = context
         self.type = getattr(self, 'type', type)
 
+    @classmethod
+    def intern(cls, href, **kwargs):
+        """
+        Returns a shared instance of this class for the given href, creating
+        one only if no live instance exists yet. Real traffic repeats the
+        same @mention and link urls constantly; interning keeps one object
+        per unique href instead of one per reference. Interned links are
+        shared, so they should be treated as read-only
+        :param href: the url the link points to
+        :param kwargs: constructor arguments used when the href is new
+        :return: a shared instance of cls for the href
+        """
+        link = _interned_links.get((cls, href))
+        if link is None:
+            link = cls(href=href, **kwargs)
+            _interned_links[(cls, href)] = link
+        return link
+
     @classmethod
     def get(cls, data, *args, **kwargs):
         """
@@ -253,6 +298,7 @@ class Activity(Object):
     :arg actor:
     """
     type = "Activity"
+    __match_args__ = ('type', 'actor', 'object')
 
     def __init__(self, id=None, type=None, attachment=None, attributedTo=None,
                  audience=None, content=None, context=None, name=None,
@@ -293,28 +339,9 @@ class IntransitiveActivity(Activity):
     """
     type = "IntransitiveActivity"
 
-    def __init__(self, id=None, type=None, attachment=None, attributedTo=None,
-                 audience=None, content=None, context=None, name=None,
-                 endTime=None, generator=None, icon=None, image=None,
-                 inReplyTo=None, location=None, preview=None, published=None,
-                 replies=None, startTime=None, summary=None, tag=None,
-                 updated=None, url=None, to=None, bto=None, cc=None, bcc=None,
-                 mediaType=None, duration=None, actor=None, object=None,
-                 target=None, result=None, origin=None, instrument=None,
-                 acontext='https://www.w3.org/ns/activitystreams', **kwargs):
-        super().__init__(id=id, type=type, attachment=attachment,
-                         attributedTo=attributedTo, audience=audience,
-                         content=content, context=context, name=name,
-                         endTime=endTime, generator=generator, icon=icon,
-                         image=image, inReplyTo=inReplyTo,
-                         location=location, preview=preview,
-                         published=published, replies=replies,
-                         startTime=startTime, summary=summary,
-                         tag=tag, updated=updated, url=url, to=to, bto=bto,
-                         cc=cc, bcc=bcc, mediaType=mediaType,
-                         duration=duration, actor=actor, object=object,
-                         target=target, result=result, origin=origin,
-                         instrument=instrument, acontext=acontext, **kwargs)
+    # no __init__ override; the signature (and the tooltip it produces) is
+    # identical to Activity's, so defining one here would only rebind every
+    # keyword a second time on each instantiation
 
 
 class Collection(Object):
@@ -454,8 +481,10 @@ class OrderedCollectionPage(OrderedCollection, CollectionPage):
                  prev=None, startIndex=None, orderedItems=None,
                  acontext='https://www.w3.org/ns/activitystreams', **kwargs):
         # OrderedCollection has no special handling in its init that
-        # CollectionPage doesn't already do
-        OrderedCollection.__init__(self, orderedItems=orderedItems)
+        # CollectionPage doesn't already do beyond setting orderedItems, so
+        # set that directly instead of running the whole constructor chain a
+        # second time with default values
+        self.orderedItems = orderedItems
         CollectionPage.__init__(self, id=id, type=type,
                                 attachment=attachment,
                                 attributedTo=attributedTo,
@@ -473,8 +502,8 @@ class OrderedCollectionPage(OrderedCollection, CollectionPage):
                                 cc=cc, bcc=bcc, mediaType=mediaType,
                                 duration=duration, totalItems=totalItems,
                                 current=current, first=first, last=last,
-                                partOf=partOf, next=next, prev=prev,
-                                acontext=acontext)
+                                items=items, partOf=partOf, next=next,
+                                prev=prev, acontext=acontext)
         self.startIndex = startIndex if startIndex else 0
 
 
@@ -127,76 +127,48 @@ pkg_properties = (
     properties.Deleted
 )
 
+# which property classes belong to which model; property_mapping below is
+# derived from this in one pass rather than spelling out
+# "__get_namespace__()" several dozen times
+class_properties = {
+    models.Object: (properties.Id, properties.Type, properties.Attachment,
+                    properties.AttributedTo, properties.Audience,
+                    properties.Content, properties.Name, properties.EndTime,
+                    properties.Generator, properties.Icon, properties.Image,
+                    properties.InReplyTo, properties.Location,
+                    properties.Preview, properties.Published,
+                    properties.Replies, properties.StartTime,
+                    properties.Summary, properties.Tag, properties.Updated,
+                    properties.Url, properties.To, properties.Bto,
+                    properties.Cc, properties.Bcc, properties.MediaType,
+                    properties.Duration),
+    models.Link: (properties.Id, properties.Type, properties.Href,
+                  properties.Rel, properties.MediaType, properties.Name,
+                  properties.HrefLang, properties.Height, properties.Width,
+                  properties.Preview),
+    models.Activity: (properties.Actor, properties.Object, properties.Target,
+                      properties.Result, properties.Origin,
+                      properties.Instrument),
+    models.Collection: (properties.TotalItems, properties.Current,
+                        properties.First, properties.Last, properties.Items,
+                        properties.OrderedItems, properties.UnorderedItems),
+    models.CollectionPage: (properties.PartOf, properties.Next,
+                            properties.Prev),
+    models.OrderedCollectionPage: (properties.StartIndex,),
+    models.Question: (properties.OneOf, properties.AnyOf, properties.Closed),
+    models.Relationship: (properties.Subject, properties.Object,
+                          properties.Relationship),
+    models.Place: (properties.Accuracy, properties.Altitude,
+                   properties.Latitude, properties.Longitude,
+                   properties.Radius, properties.Units),
+    models.Profile: (properties.Describes,),
+    models.Tombstone: (properties.FormerType, properties.Deleted),
+}
+
 property_mapping = {
-    models.Object.__get_namespace__(): (properties.Id.__get_namespace__(),
-                                        properties.Type.__get_namespace__(),
-                                        properties.Attachment.__get_namespace__(),
-                                        properties.AttributedTo.__get_namespace__(),
-                                        properties.Audience.__get_namespace__(),
-                                        properties.Content.__get_namespace__(),
-                                        properties.Name.__get_namespace__(),
-                                        properties.EndTime.__get_namespace__(),
-                                        properties.Generator.__get_namespace__(),
-                                        properties.Icon.__get_namespace__(),
-                                        properties.Image.__get_namespace__(),
-                                        properties.InReplyTo.__get_namespace__(),
-                                        properties.Location.__get_namespace__(),
-                                        properties.Preview.__get_namespace__(),
-                                        properties.Published.__get_namespace__(),
-                                        properties.Replies.__get_namespace__(),
-                                        properties.StartTime.__get_namespace__(),
-                                        properties.Summary.__get_namespace__(),
-                                        properties.Tag.__get_namespace__(),
-                                        properties.Updated.__get_namespace__(),
-                                        properties.Url.__get_namespace__(),
-                                        properties.To.__get_namespace__(),
-                                        properties.Bto.__get_namespace__(),
-                                        properties.Cc.__get_namespace__(),
-                                        properties.Bcc.__get_namespace__(),
-                                        properties.MediaType.__get_namespace__(),
-                                        properties.Duration.__get_namespace__(),),
-    models.Link.__get_namespace__(): (properties.Id.__get_namespace__(),
-                                      properties.Type.__get_namespace__(),
-                                      properties.Href.__get_namespace__(),
-                                      properties.Rel.__get_namespace__(),
-                                      properties.MediaType.__get_namespace__(),
-                                      properties.Name.__get_namespace__(),
-                                      properties.HrefLang.__get_namespace__(),
-                                      properties.Height.__get_namespace__(),
-                                      properties.Width.__get_namespace__(),
-                                      properties.Preview.__get_namespace__(),),
-    models.Activity.__get_namespace__(): (properties.Actor.__get_namespace__(),
-                                          properties.Object.__get_namespace__(),
-                                          properties.Target.__get_namespace__(),
-                                          properties.Result.__get_namespace__(),
-                                          properties.Origin.__get_namespace__(),
-                                          properties.Instrument.__get_namespace__(),),
-    models.Collection.__get_namespace__(): (properties.TotalItems.__get_namespace__(),
-                                            properties.Current.__get_namespace__(),
-                                            properties.First.__get_namespace__(),
-                                            properties.Last.__get_namespace__(),
-                                            properties.Items.__get_namespace__(),
-                                            properties.OrderedItems.__get_namespace__(),
-                                            properties.UnorderedItems.__get_namespace__(),),
-    models.CollectionPage.__get_namespace__(): (properties.PartOf.__get_namespace__(),
-                                                properties.Next.__get_namespace__(),
-                                                properties.Prev.__get_namespace__(),),
-    models.OrderedCollectionPage.__get_namespace__(): (properties.StartIndex.__get_namespace__(),),
-    models.Question.__get_namespace__(): (properties.OneOf.__get_namespace__(),
-                                          properties.AnyOf.__get_namespace__(),
-                                          properties.Closed.__get_namespace__(),),
-    models.Relationship.__get_namespace__(): (properties.Subject.__get_namespace__(),
-                                              properties.Object.__get_namespace__(),
-                                              properties.Relationship.__get_namespace__(),),
-    models.Place.__get_namespace__(): (properties.Accuracy.__get_namespace__(),
-                                       properties.Altitude.__get_namespace__(),
-                                       properties.Latitude.__get_namespace__(),
-                                       properties.Longitude.__get_namespace__(),
-                                       properties.Radius.__get_namespace__(),
-                                       properties.Units.__get_namespace__(),),
-    models.Profile.__get_namespace__(): (properties.Describes.__get_namespace__(),),
-    models.Tombstone.__get_namespace__(): (properties.FormerType.__get_namespace__(),
-                                           properties.Deleted.__get_namespace__(),)
+    cls.__get_namespace__(): tuple(prop.__get_namespace__()
+                                   for prop in props)
+    for cls, props in class_properties.items()
 }
 
 def create_package():
@@ -24,6 +24,21 @@ logger.setLevel(logging.INFO)
 
 SECURE_URLS_ONLY = False
 
+# lets consumers star-import the property vocabulary in one statement
+__all__ = [
+    'ActivityStreamsProperty',
+    'Id', 'Type', 'Attachment', 'AttributedTo', 'Actor', 'Audience', 'Bcc',
+    'Bto', 'Cc', 'Context', 'Current', 'First', 'Generator', 'Icon', 'Image',
+    'InReplyTo', 'Instrument', 'Last', 'Location', 'Items', 'OrderedItems',
+    'UnorderedItems', 'OneOf', 'AnyOf', 'Closed', 'Origin', 'Next', 'Object',
+    'Prev', 'Preview', 'Result', 'Replies', 'Tag', 'Target', 'To', 'Url',
+    'Accuracy', 'Altitude', 'Content', 'Name', 'Duration', 'Height', 'Href',
+    'HrefLang', 'PartOf', 'Latitude', 'Longitude', 'MediaType', 'EndTime',
+    'Published', 'StartTime', 'Radius', 'Rel', 'StartIndex', 'Summary',
+    'TotalItems', 'Units', 'Updated', 'Width', 'Subject', 'Relationship',
+    'Describes', 'FormerType', 'Deleted',
+]
+
 
 class ActivityStreamsProperty(JsonProperty):
     @classmethod
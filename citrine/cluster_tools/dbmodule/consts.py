@@ -2,7 +2,9 @@
 Constant strings for cluster tools, mostly boilerplate for generating files
 """
 
-DBMODULE_DISCOVERABLE_INIT = '''"""
+# the discoverable and undiscoverable variants only differ by one boolean, so
+# both are rendered from a single template
+DBMODULE_INIT_TEMPLATE = '''"""
 AUTOGENERATED INIT FILE FOR DBMODULE
 """
 from os.path import dirname, exists, join, split
@@ -11,20 +13,13 @@ DB_ID = split(dirname(__file__))[1]
 DB_PATH = join(dirname(__file__), DB_ID)
 db = lambda: CitrineDB(DB_PATH, database_name=DB_ID) if exists(DB_PATH) else CitrineDB.new(DB_PATH, database_name=DB_ID)
 DB_MODULE = True
-DISCOVERABLE = True
+DISCOVERABLE = {discoverable}
 '''
 
-DBMODULE_UNDISCOVERABLE_INIT = '''"""
-AUTOGENERATED INIT FILE FOR DBMODULE
-"""
-from os.path import dirname, exists, join, split
-from citrine import CitrineDB
-DB_ID = split(dirname(__file__))[1]
-DB_PATH = join(dirname(__file__), DB_ID)
-db = lambda: CitrineDB(DB_PATH, database_name=DB_ID) if exists(DB_PATH) else CitrineDB.new(DB_PATH, database_name=DB_ID)
-DB_MODULE = True
-DISCOVERABLE = False
-'''
+DBMODULE_DISCOVERABLE_INIT = DBMODULE_INIT_TEMPLATE.format(discoverable=True)
+
+DBMODULE_UNDISCOVERABLE_INIT = DBMODULE_INIT_TEMPLATE.format(
+    discoverable=False)
 
 # Shorthand, basically a default value
 DBMODULE_INIT = DBMODULE_DISCOVERABLE_INIT
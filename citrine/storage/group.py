@@ -13,17 +13,25 @@ maximum = max
 
 
 def get_group_index(id: str, num_collections):
-    return int.from_bytes(id.encode()) % num_collections
+    # the mapping MUST stay identical between runs or keys in
+    # already-persisted groups would become unreachable; 'big' is spelled
+    # out because the byteorder is part of that contract
+    return int.from_bytes(id.encode(), 'big') % num_collections
 
 
 def groupfn(fn):
     # they key MUST be either a kwarg OR the first positional arg
+    # the decorated method dispatches to the Collection method of the same
+    # name, bound once at decoration time; the wrapped body still runs first
+    # for its guard checks
+    coll_method = getattr(Collection, fn.__name__)
+
     def decorator(obj, *args, **kwargs):
         key = kwargs.get('key', None if not args else args[0])
         index = get_group_index(key, len(obj.collections))
         collection = obj.collections[index]
-        # fn gives us the function from Collection
-        return fn(obj, *args, **kwargs)(collection, *args, **kwargs)
+        fn(obj, *args, **kwargs)
+        return coll_method(collection, *args, **kwargs)
     return decorator
 
 
@@ -78,16 +86,17 @@ class GroupMeta(Persistent):
 
     @property
     def max_size(self):
-        return sum(collection.max_size for collection in self.collections)
+        return self.___max_size___
 
     @property
     def max_collection_size(self):
-        return max(collection.max_size for collection in self.collections)
+        return self.___max_collection_size___
 
     @property
     def usage(self):
         """Percent of used space"""
-        return self.size / self.max_size
+        # max_size is precomputed, so this is a single pass over the sizes
+        return self.size / self.___max_size___
 
     @property
     def collection_usage(self):
@@ -96,11 +105,11 @@ class GroupMeta(Persistent):
 
     @property
     def highest_collection_usage(self):
-        return max(self.collection_usage.values())
+        return max(collection.usage for collection in self.collections)
 
     @property
     def lowest_collection_usage(self):
-        return min(self.collection_usage.values())
+        return min(collection.usage for collection in self.collections)
 
     @property
     def status(self):
@@ -114,6 +123,13 @@ class GroupMeta(Persistent):
     def __init__(self, obj):
         self.obj = obj
         self.collections = tuple(self.obj.collections)
+        # the component collections and their max sizes never change for the
+        # life of a group, so the capacity aggregates are computed once here
+        # instead of re-activating every persistent collection per access
+        self.___max_size___ = sum(
+            collection.max_size for collection in self.collections)
+        self.___max_collection_size___ = max(
+            collection.max_size for collection in self.collections)
 
 
 class Group(Persistent):
@@ -183,6 +199,9 @@ class Group(Persistent):
         """
         Most urgent status among the group's collections
         """
+        # deliberately recomputed on every read: collections can be (and in
+        # practice are) written to directly, so a memoized value keyed on
+        # group-level mutations would go stale without noticing
         return self.meta.status
 
     @property
@@ -213,9 +232,15 @@ class Group(Persistent):
 
     def __init__(self, collections, strict=False, **kwargs):
         super().__init__(**kwargs)
-        # repeating UUID values
-        if len({col.uuid for col in collections}) != len(collections):
-            raise KeyError("Collections must not have conflicting UUID values")
+        # repeating UUID values; single pass that fails on the first collision
+        # rather than activating every collection before comparing counts
+        seen_uuids = set()
+        for col in collections:
+            uuid = col.uuid
+            if uuid in seen_uuids:
+                raise KeyError(
+                    "Collections must not have conflicting UUID values")
+            seen_uuids.add(uuid)
         self.___collections___ = collections
         self.___metadata___ = GroupMeta(self)
         self.strict = strict
@@ -278,10 +303,9 @@ class Group(Persistent):
             size = max(custom.keys())
         if size and size < max(custom.keys()):
             raise KeyError("Size must be greater than highest key")
-        # fill gaps with default generation
-        for key in range(size):
-            if key not in keys:
-                custom[key] = max_collection_size
+        # fill gaps with default generation; explicit definitions win over
+        # the defaults without any per-key membership scans
+        custom = {**dict.fromkeys(range(size), max_collection_size), **custom}
         for key, value in custom.items():
             if value <= 0:
                 raise ValueError('Collection sizes cannot be less than 1')
@@ -298,7 +322,6 @@ class Group(Persistent):
         :param key: the key associated with the desired item
         :param default: value to return if the key does not exist
         """
-        return Collection.get
 
     @groupfn
     def insert(self, key, value):
@@ -313,7 +336,6 @@ class Group(Persistent):
                 and key not in self.keys()
                 and self.strict):
             raise GroupCapacityError("Maximum size reached! Cannot insert")
-        return Collection.insert
 
     def update(self, collection):
         """
@@ -322,18 +344,27 @@ class Group(Persistent):
         :raises CollectionCapacityError: if the size of the new keys to be
         inserted will exceed the limit in strict mode
         """
-        new_keys = (key for key in collection.keys() if key not in self.keys())
-        if len(tuple(new_keys)) + self.size > self.max_size and self.strict:
-            raise GroupCapacityError("Maximum size reached! Cannot perform update")
-
         num_collections = len(self.collections)
-        split_collection = {_: {} for _ in range(len(self.collections))}
+        split_collection = dict()
         for key, value in collection.items():
-            split_collection[get_group_index(key, num_collections)][key] = value
-        split_collection = {k: v for k, v in split_collection.items() if v}
-
-        for index, collection in split_collection.items():
-            self.collections[index].update(collection)
+            index = get_group_index(key, num_collections)
+            split_collection.setdefault(index, dict())[key] = value
+
+        if self.strict:
+            # a key can only ever live in its own shard, so membership only
+            # needs to be checked against the collection it maps to; the
+            # non-strict path skips the checks entirely
+            new_keys = sum(
+                1 for index, items in split_collection.items()
+                for key in items
+                if not self.collections[index].has_key(key)
+            )
+            if new_keys + self.size > self.max_size:
+                raise GroupCapacityError(
+                    "Maximum size reached! Cannot perform update")
+
+        for index, items in split_collection.items():
+            self.collections[index].update(items)
 
     @groupfn
     def pop(self, key, default=None):
@@ -343,7 +374,6 @@ class Group(Persistent):
         :param default: alternate value to return if the key is not present
         :return:
         """
-        return Collection.pop
 
     def popitem(self):
         """
@@ -361,7 +391,6 @@ class Group(Persistent):
         :param value: the value to write, if applicable
         :return: existing value or provided value if no value currently exists
         """
-        return Collection.setdefault
 
     def clear(self):
         """
@@ -514,4 +543,3 @@ class Group(Persistent):
         :param key: the desired identifier
         :return: whether the key is present as a boolean
         """
-        return Collection.has_key
@@ -125,6 +125,24 @@ class CachedRequestsJsonLoader(RequestsJsonLoader):
     def __init__(self, secure=True, headers=None):
         super().__init__(secure=secure, headers=headers)
 
+    @classmethod
+    def preload(cls, url, document, content_type='application/ld+json'):
+        """
+        Seeds the schema cache with an in-memory document so requests for the
+        given url never leave the process. Intended for pinning well-known
+        contexts (e.g. the ActivityStreams context) at startup
+        :param url: the url the document should be served for
+        :param document: the parsed json-ld document as a dict
+        :param content_type: content type to report for the document
+        """
+        cls.logger.info(f'Preloading schema for {url}')
+        cls.cached_schemas[url] = {
+            'contentType': content_type,
+            'contextUrl': None,
+            'documentUrl': url,
+            'document': document,
+        }
+
     def __call__(self, url, *args, **kwargs):
         """
         Passes the url into RequestsDocumentLoader().get(url)
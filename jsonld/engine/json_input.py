@@ -3,7 +3,9 @@ Module for separating logic for generating objects from JSON-LD input
 """
 import json
 import logging
+from collections import deque
 from collections.abc import Iterable
+from functools import lru_cache
 from itertools import chain
 from numbers import Number
 from typing import Union
@@ -15,6 +17,135 @@ from jsonld.utils import DEFAULT_CONTEXT
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# marks work-stack frames that construct a linked object once its fields have
+# all been resolved
+_BUILD_OBJECT = object()
+
+# per-class frozensets of @property names; decoding touches this once per
+# object so we don't want __get_properties__ rescanning the mro each time
+_PROPS_CACHE = dict()
+
+
+def _class_properties(object_class):
+    """
+    Returns the property names of a class as a frozenset, cached per class
+    :param object_class: the class to pull property names from
+    :return: frozenset of @property names
+    """
+    props = _PROPS_CACHE.get(object_class)
+    if props is None:
+        props = _PROPS_CACHE.setdefault(
+            object_class, frozenset(object_class.__get_properties__()))
+    return props
+
+
+# canonical instances of previously-seen context dicts, keyed by content, so
+# every document sharing a context passes the same object to pyld
+_CTX_INTERN = dict()
+
+
+def _intern_context(context):
+    """
+    Returns a canonical shared instance of the given context. Documents using
+    an identical context then hand pyld (and the expand cache) one object
+    instead of a thousand equal copies
+    :param context: the json-ld context to intern
+    :return: the canonical instance for the context's content
+    """
+    # strings are already interned well enough by the VM
+    if isinstance(context, str):
+        return context
+    try:
+        key = json.dumps(context, sort_keys=True)
+    except TypeError:
+        return context
+    return _CTX_INTERN.setdefault(key, context)
+
+
+# per-context frozensets of terms that alias '@type', keyed by id with the
+# context kept alongside so an entry can never be mistaken for a different
+# dict that happens to reuse the same id
+_TYPE_ALIAS_CACHE = dict()
+
+
+def _type_aliases(context):
+    """
+    Returns the terms a dict context maps onto '@type', either directly
+    ("term": "@type") or through an expanded definition ("term":
+    {"@id": "@type"}). Contexts are interned, so this is effectively
+    computed once per distinct context
+    :param context: a json-ld context dict
+    :return: frozenset of aliasing terms
+    """
+    entry = _TYPE_ALIAS_CACHE.get(id(context))
+    if entry is not None and entry[0] is context:
+        return entry[1]
+    aliases = frozenset(
+        term for term, defn in context.items()
+        if defn == '@type'
+        or (isinstance(defn, dict) and defn.get('@id') == '@type'))
+    _TYPE_ALIAS_CACHE[id(context)] = (context, aliases)
+    return aliases
+
+
+# decoder functions specialized per class; see _compile_decoder
+_DECODER_CACHE = dict()
+
+
+def _compile_decoder(object_class):
+    """
+    Builds (once per class) a decoder closure that turns a json dict into an
+    instance of the class. The closure captures the class, its property set,
+    and a pre-filled None template so none of them are rediscovered per object
+    :param object_class: the class the decoder should produce
+    :return: callable taking (intake, data, context)
+    """
+    decoder = _DECODER_CACHE.get(object_class)
+    if decoder is None:
+        props = _class_properties(object_class)
+        template = dict.fromkeys(props)
+
+        def decoder(intake, data, context):
+            # only include values from the json that are properties of the
+            # class; everything else stays pre-filled with None
+            fields = template.copy()
+            for key in data.keys() & props:
+                fields[key] = intake._unpack_objects(data[key], context)
+            fields['acontext'] = context
+            return object_class(**fields)
+
+        decoder = _DECODER_CACHE.setdefault(object_class, decoder)
+    return decoder
+
+
+@lru_cache(maxsize=1024)
+def _expand_frozen(frozen_json: str):
+    """
+    Expands a json-ld document that has been frozen into a sorted-key json
+    string. The string form gives us a hashable key so repeated expansions of
+    the same context+shape only hit pyld once
+    :param frozen_json: json.dumps(data, sort_keys=True) form of the document
+    :return: the pyld-expanded form of the document
+    """
+    return expand(json.loads(frozen_json))
+
+
+def _expand_cached(data):
+    """
+    Cached wrapper around pyld's expand. Expanding the same context over and
+    over is the dominant cost of parsing nested json-ld, so we key the
+    expansion on the document content and reuse the result. Callers MUST NOT
+    modify the returned structure, it is shared between calls!
+    :param data: json-ld data to expand
+    :return: the pyld-expanded form of the data
+    """
+    try:
+        return _expand_frozen(json.dumps(data, sort_keys=True))
+    except TypeError:
+        # non-json-serializable values can't be frozen into a cache key;
+        # fall back to a direct (uncached) expansion
+        return expand(data)
+
 
 class PropertyJsonIntake:
     """
@@ -37,14 +168,15 @@ class PropertyJsonIntake:
             self.___property_registry___ = dict()
         return self.___property_registry___
 
-    def _get_object_class(self, data):
+    def _get_object_class(self, data, pre_expanded=False):
         """
         If the data has a recognized @type value (after json-ld expansion) then
         returns the class registered to the given @type. Returns None otherwise
         :param data: json-ld data to examine
+        :param pre_expanded: whether data is already in pyld-expanded form
         :return: object fitting the type or None
         """
-        expanded = expand(data)
+        expanded = data if pre_expanded else _expand_cached(data)
         if len(expanded) < 1:
             # if the list is empty, assume it is because there are no values
             # provided other than @context and id, which produces an empty list
@@ -54,49 +186,138 @@ class PropertyJsonIntake:
         if not class_type:
             logger.debug(f'No @type value provided:\n{expanded}')
 
+        # bind the registry once; the property re-checks the backing attribute
+        # on every access and this method runs once per decoded object
+        registry = self.class_registry
+
         # check that the @type value is in the mapping
-        if class_type not in self.class_registry.keys():
+        if class_type not in registry:
             # if the class type is not in our mapping, use the default value
             logger.debug(f'@type value not in mapping: "{class_type}"')
             class_type = 'default'
 
         # gets the class for the object that needs to be created from the
-        object_class = self.class_registry.get(class_type)
+        object_class = registry.get(class_type)
         if not object_class:
             ValueError(f'Provided data has invalid or missing "@type"')
         return object_class
 
     def _unpack_objects(self, data, context):
         """
-        Recursively unpacks a piece of data into flat values, lists (arrays),
-        and linked objects
+        Unpacks a piece of data into flat values, lists (arrays), and linked
+        objects. Walks the structure with an explicit work stack instead of
+        recursing, keeping the walk itself off the interpreter call stack
+        (expansion of nested documents still recurses inside json.dumps and
+        pyld, so extremely deep documents remain bounded by those, as before)
         :param data: the data to evaluate
         :param context: the json-ld context this is being performed under
         :return: flat value, python object, or list
         """
-        # if the value is a basic type (str, bool, or number) then return the
-        # raw value, we don't need to handle those in a special way
-        if data is None or isinstance(data, (Number, str, bool)):
-            return data
-        if isinstance(data, dict):
-            # treat a nested dictionary like a linked object
-            # context has to be appended to read objects individually
-            context_val = {'@context': context, **data}
-
-            # if there is no @type value in the expanded form, assume this is
-            # just supposed to be a regular dictionary
-            type = expand(context_val)
-            if len(type) < 1 or type[0].get('@type', None) is None:
-                return {key: self._unpack_objects(val, context)
-                        for key, val in data.items()}
-
-            if self._get_object_class(context_val):
-                return self.from_json(context_val)
-            return None
-        if isinstance(data, Iterable):
-            # turn iterables into lists and evaluate everything inside
-            return [self._unpack_objects(item, context)
-                    for item in data]
+        # localize the hot globals; the loop below can run tens of thousands
+        # of times per document and LOAD_FAST beats LOAD_GLOBAL every frame
+        expand_cached = _expand_cached
+        intern_context = _intern_context
+        class_properties = _class_properties
+        build_object = _BUILD_OBJECT
+
+        # each frame is (container, key, value, context); resolved values are
+        # written into container[key] so parents assemble as children finish
+        root = [None]
+        stack = deque()
+        stack.append((root, 0, data, context))
+        while stack:
+            frame = stack.pop()
+            if frame[0] is build_object:
+                # all of this object's fields have been resolved into the
+                # fields dict; construct it and hand it to the parent
+                _, container, key, object_class, fields, obj_context = frame
+                container[key] = object_class(
+                    **{**fields, 'acontext': obj_context})
+                continue
+            container, key, value, ctx = frame
+            # if the value is a basic type (str, bool, or number) then keep the
+            # raw value, we don't need to handle those in a special way. exact
+            # type checks cover the common leaves without the ABC isinstance
+            # machinery; strings are by far the most frequent so they go first
+            t = type(value)
+            if t is str or t is int or t is float or t is bool \
+                    or value is None:
+                container[key] = value
+                continue
+            if isinstance(value, (Number, str)):
+                # flat values using subclassed types still pass through as-is
+                container[key] = value
+                continue
+            if isinstance(value, dict):
+                # plain "data bag" dicts are common; if nothing in the dict
+                # could plausibly carry a type we can skip pyld entirely.
+                # dict contexts can alias '@type' onto arbitrary terms, so
+                # their alias set is checked as well; contexts that can't be
+                # inspected locally (lists, etc.) always expand
+                t_ctx = type(ctx)
+                if '@type' not in value and 'type' not in value \
+                        and '@context' not in value \
+                        and (t_ctx is str
+                             or (t_ctx is dict
+                                 and not (_type_aliases(ctx)
+                                          & value.keys()))):
+                    new_dict = dict()
+                    container[key] = new_dict
+                    # pushed in reverse so the LIFO pop order rebuilds the
+                    # dict with the source document's key order
+                    for k, v in reversed(value.items()):
+                        stack.append((new_dict, k, v, ctx))
+                    continue
+                # treat a nested dictionary like a linked object
+                # context has to be appended to read objects individually
+                context_val = {'@context': ctx, **value}
+
+                # if there is no @type value in the expanded form, assume this
+                # is just supposed to be a regular dictionary
+                expanded = expand_cached(context_val)
+                if len(expanded) < 1 or \
+                        expanded[0].get('@type', None) is None:
+                    new_dict = dict()
+                    container[key] = new_dict
+                    # pushed in reverse so the LIFO pop order rebuilds the
+                    # dict with the source document's key order
+                    for k, v in reversed(value.items()):
+                        stack.append((new_dict, k, v, ctx))
+                    continue
+
+                object_class = self._get_object_class(expanded,
+                                                      pre_expanded=True)
+                if not object_class:
+                    container[key] = None
+                    continue
+                obj_context = intern_context(
+                    context_val.get('@context', DEFAULT_CONTEXT))
+                props = class_properties(object_class)
+                # pre-fill every property with None so absent values are still
+                # passed explicitly, then only walk properties that actually
+                # appear in the data
+                fields = dict.fromkeys(props)
+                # the build frame goes under the field frames so the object is
+                # constructed only after every field has resolved
+                stack.append((build_object, container, key, object_class,
+                              fields, obj_context))
+                for prop in reversed([k for k in context_val if k in props]):
+                    stack.append((fields, prop, context_val[prop],
+                                  obj_context))
+                continue
+            # lists and tuples are the only iterables json input actually
+            # produces; the exact-type check spares them the ABCMeta
+            # __instancecheck__ walk that isinstance(value, Iterable) costs
+            if t is list or t is tuple or isinstance(value, Iterable):
+                # turn iterables into lists and evaluate everything inside
+                items = list(value)
+                new_list = [None] * len(items)
+                container[key] = new_list
+                for index, item in enumerate(items):
+                    stack.append((new_list, index, item, ctx))
+                continue
+            container[key] = None
+        return root[0]
 
     def from_json(self, data: Union[str, dict]):
         """
@@ -105,19 +326,14 @@ class PropertyJsonIntake:
         :param data: JSON data to transform into Python object
         :return: Python object
         """
-        # convert to dict and expand
-        data = json.loads(data) if isinstance(data, str) else data.copy()
-        context = data.get('@context', DEFAULT_CONTEXT)
+        # convert to dict and expand; json text already gives us a fresh dict
+        # and an incoming dict is only copied if we have to write into it
+        data = json.loads(data) if isinstance(data, str) else data
+        context = _intern_context(data.get('@context', DEFAULT_CONTEXT))
         if not data.get('@context', None):
             logger.debug(f"No '@context' provided, using '{DEFAULT_CONTEXT}'")
-            data.update({'@context': DEFAULT_CONTEXT})
+            data = {**data, '@context': DEFAULT_CONTEXT}
         object_class = self._get_object_class(data)
 
-        # only include values from the json that are properties of the class
-        # unpack data structures and populate None values where appropriate
-        filtered_data = {
-            key: self._unpack_objects(data.get(key, None), context)
-            for key in object_class.__get_properties__()
-        }
-
-        return object_class(**{**filtered_data, 'acontext': context})
+        # hand the data off to the decoder specialized for this class
+        return _compile_decoder(object_class)(self, data, context)
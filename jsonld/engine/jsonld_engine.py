@@ -69,6 +69,22 @@ class JsonLdEngine(PropertyJsonIntake):
         # give registered classes a reference back to their engine
         setattr(cls, '__jsonld_engine__', self)
 
+    def create(self, name, /, **kwargs):
+        """
+        Creates an object from one of the engine's registered classes using
+        the class name. A single dispatcher keyed on the name avoids needing
+        a dedicated factory method for every class a package registers. The
+        class name is positional-only so it cannot collide with a "name"
+        property on the object being created
+        :param name: the __name__ of a registered class
+        :param kwargs: constructor arguments for the class
+        :return: an instance of the registered class
+        """
+        cls = getattr(self, name, None)
+        if not isinstance(cls, type):
+            raise ValueError(f'"{name}" is not a registered class')
+        return cls(**kwargs)
+
     # TODO: set up method that handles queues and connect to __getitem__ for
     #   easy handling of a data queue (vital for multithreading!)
     def __getitem__(self, keys):
@@ -24,6 +24,11 @@ class PropertyJsonLD(PropertyAwareObject):
     # as objects
     type_constructor_map = {}
 
+    # NOTE: do not add __slots__ here (or on any class the packages clone):
+    # ClassCloner rebuilds classes with type(name, bases, cls.__dict__.copy()),
+    # and copying a class dict that holds both __slots__ and its member
+    # descriptors raises "conflicts with class variable" at package build
+
     def __init__(self, acontext):
         PropertyAwareObject.__init__(self)
         self.acontext = acontext
@@ -42,6 +47,28 @@ class PropertyJsonLD(PropertyAwareObject):
     def acontext(self, value):
         self.___acontext___ = value
 
+    @classmethod
+    def _fast_new(cls, acontext=None, **fields):
+        """
+        Builds an instance without running the layered __init__ chain. Values
+        still pass through their property setters, so validation and other
+        setter behavior matches a normal construction; only the stacked
+        constructor calls (and the dozens of keyword rebinds each performs)
+        are skipped. Intended for trusted internal code; fields that are not
+        provided are never written and fall back to their getters' defaults,
+        which also means derived defaults normally computed in __init__
+        (e.g. sizes taken from other fields) are not filled in
+        :param acontext: JSON-LD processing context for the new object
+        :param fields: property values to set on the new instance
+        :return: instance of cls
+        """
+        inst = cls.__new__(cls)
+        PropertyAwareObject.__init__(inst)
+        inst.acontext = acontext
+        for name, value in fields.items():
+            setattr(inst, name, value)
+        return inst
+
     __data_handler_fns = {
         str: lambda val, *args, **kwargs: val,
         int: lambda val, *args, **kwargs: val,
@@ -113,7 +113,10 @@ class ClassCloner:
         # merge both for simplicity and to avoid setting the same values twice
         data = {**props, **attrs}
         obj.__class__ = new_class
-        obj.__properties__ = obj.__get_properties__(refresh=True)
+        # wrap_properties already rebuilt every clone's property cache when
+        # the package was constructed, so read the per-class cache instead of
+        # rescanning the mro for every object that changes class
+        obj.__properties__ = obj.__get_properties__()
         for name, val in data.items():
             try:
                 setattr(obj, name, val)